@@ -3,26 +3,38 @@ Receives UI intents, instantiates Model & Device, relays updates up.
 """
 
 from __future__ import annotations
-from queue import Queue
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Dict, List, Optional, Union
 
-from ..devices.rs232_device import RS232Device
+from ..devices.base import Sample
 from ..devices.simulated_device import SimulatedDevice
 from ..model.model import MeasurementModel
 from ..utils.logger import CsvLogger
 
-Update = Dict[str, Any]
+Update = Union[Sample, Dict[str, str]]
+
+_QUEUE_LEN = 1024  # updates held for the UI between reruns
+
+
+def _close_port(device) -> None:
+    """Close a real device's pooled port so other programs can open it."""
+    port = getattr(device, "port", None)
+    if port is not None:  # only RS232Device has one; pyserial already loaded
+        from ..devices.rs232_device import SerialPortPool
+
+        SerialPortPool.discard(port)
 
 
 class Controller:
     """
     The Controller is intentionally very thin; it marshals config
     from the UI into model/device objects and publishes a thread‑safe
-    message queue back to the UI.
+    message queue back to the UI (a bounded deque: `append`/`popleft`
+    are atomic, and the oldest samples drop if the UI stalls).
     """
 
     def __init__(self) -> None:
-        self._queue: "Queue[Update]" = Queue()
+        self._queue: "deque[Update]" = deque(maxlen=_QUEUE_LEN)
         self._model: Optional[MeasurementModel] = None
 
     # -------- Lifecycle -------- #
@@ -35,16 +47,22 @@ class Controller:
         poll: float = 0.5,
         unit: str = "torr",
     ) -> None:
+        # imported here so simulated runs never load pyserial
+        from ..devices.rs232_device import RS232Device
+
         device = RS232Device(port=port, baudrate=baudrate, address=address)
         # set hardware unit once, before polling thread starts
         try:
             device.connect()
             device.set_pressure_unit(unit)
+        except Exception:
+            _close_port(device)  # don't keep holding a port we won't poll
+            raise
         finally:
-            device.disconnect()
+            device.disconnect()  # the pooled handle stays open for the model
 
         self._pending_unit = None
-        self._start_model(device, poll, log_prefix="real")
+        self._start_model(device, poll, log_prefix="real", unit=unit)
 
     def start_simulated(self, poll: float = 0.5, unit: str = "torr") -> None:
         device = SimulatedDevice()
@@ -53,8 +71,12 @@ class Controller:
 
     def stop(self) -> None:
         if self._model:
-            self._model.stop()
-            self._model = None
+            # cleared first: stop() re-raises a poll-loop crash
+            model, self._model = self._model, None
+            try:
+                model.stop()
+            finally:
+                _close_port(model.device)
 
     def set_unit(self, unit: str) -> None:
         """
@@ -65,18 +87,23 @@ class Controller:
         self._pending_unit = unit
         # if already running, apply directly to device and logger
         if self._model:
+            model = self._model
+            # paused so the poller never logs to a logger being swapped out
+            model.stop()
             # tell the hardware
-            if hasattr(self._model.device, "set_pressure_unit"):
-                self._model.device.set_pressure_unit(unit)
+            if hasattr(model.device, "set_pressure_unit"):
+                model.device.connect()
+                model.device.set_pressure_unit(unit)
             # recreate the logger with new unit (optional: you could reopen a new file)
-            self._model.logger = CsvLogger(prefix="real" if isinstance(self._model.device, RS232Device) else "sim", unit=unit)
+            model.logger = CsvLogger(prefix=model.logger.prefix, unit=unit)
+            model.start()
     
     # ------------------------------------------------------------------ #
-    #  Change pressure unit mid-run: stop → reconnect → set → restart    #
+    #  Change pressure unit mid-run: stop → set → restart                #
     # ------------------------------------------------------------------ #
     def change_unit(self, unit: str, poll: float = 0.5) -> None:
         """
-        Stop current model, send U!P,<unit>\ on a fresh connection,
+        Stop current model, send U!P,<unit>\ on the pooled connection,
         clear logger/dataframe, then restart polling.
         """
         if not self._model:
@@ -84,41 +111,51 @@ class Controller:
 
         # 1) Grab the existing device instance and stop polling.
         device = self._model.device
-        self._model.stop()
-        self._model = None           # avoid double-close
+        log_prefix = self._model.logger.prefix
+        model, self._model = self._model, None  # avoid double-close
+        try:
+            model.stop()
 
-        # 2) Re-open the serial port (real device only) and set unit.
-        if isinstance(device, RS232Device):
-            device.connect()
-            try:
+            # 2) Set unit (real device only); the port stays open in the pool.
+            if hasattr(device, "set_pressure_unit"):
+                device.connect()
                 device.set_pressure_unit(unit)
-            finally:
-                device.disconnect()
+        except Exception:
+            _close_port(device)  # no model is left to release it on stop()
+            raise
 
         # 3) Start a new MeasurementModel (fresh logger/dataframe).
         self._model = MeasurementModel(
             device,
             poll_interval=poll,
-            log_prefix="real" if isinstance(device, RS232Device) else "sim",
+            log_prefix=log_prefix,
             unit=unit,
         )
-        self._model.subscribe(self._queue.put)
+        self._model.subscribe(self._queue.append)
         self._model.start()
 
     
     # -------- Public getters -------- #
 
     @property
-    def queue(self) -> "Queue[Update]":
+    def queue(self) -> "deque[Update]":
         return self._queue
 
+    def drain_all(self) -> List[Update]:
+        """
+        Remove and return every queued update, oldest first. The UI is the
+        only consumer, so popping the current length never races the model.
+        """
+        q = self._queue
+        return [q.popleft() for _ in range(len(q))]
+
     # -------- Private helpers -------- #
 
-    def _start_model(self, device, poll, log_prefix: str) -> None:
+    def _start_model(self, device, poll, log_prefix: str, unit: str) -> None:
         if self._model:
             self.stop()
         self._model = MeasurementModel(
-            device, poll_interval=poll, log_prefix=log_prefix
-        )        
-        self._model.subscribe(self._queue.put)
+            device, poll_interval=poll, log_prefix=log_prefix, unit=unit
+        )
+        self._model.subscribe(self._queue.append)
         self._model.start()
@@ -3,13 +3,26 @@ Abstract base classes for device adapters.
 """
 
 from __future__ import annotations
+import time
 from abc import ABC, abstractmethod
-from typing import Tuple, Dict, Any
+from dataclasses import dataclass
 
 class DeviceError(Exception):
     """Raised when the device returns an unexpected response or times out."""
 
 
+@dataclass
+class Sample:
+    """One pressure/temperature reading; `ts` is the epoch time it was taken."""
+
+    # spelled out rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("pressure", "temperature", "ts")
+
+    pressure: float
+    temperature: float
+    ts: float
+
+
 class BaseDevice(ABC):
     """Common interface for real and simulated devices."""
 
@@ -36,12 +49,9 @@ class BaseDevice(ABC):
 
     # -------- Convenience helpers -------- #
 
-    def query(self) -> Dict[str, Any]:
-        """Return both pressure & temperature as a dict."""
-        return {
-            "pressure": self.read_pressure(),
-            "temperature": self.read_temperature(),
-        }
+    def query(self) -> Sample:
+        """Return both pressure & temperature as a Sample."""
+        return Sample(self.read_pressure(), self.read_temperature(), time.time())
 
     # Context‑manager sugar
     def __enter__(self) -> "BaseDevice":
@@ -3,14 +3,61 @@ RS‑232 implementation for the DigiVac Quantum DPP series.
 """
 
 from __future__ import annotations
+import re
 import serial
+import sys
 import threading
-from time import sleep
-from typing import Optional
-from .base import BaseDevice, DeviceError
+from time import sleep, time
+from typing import Any, Dict, NoReturn, Optional, Tuple
+from .base import BaseDevice, DeviceError, Sample
+
+_TERMINATOR = b"\\r\n"  # DigiVac default
+# `[@addr]ACK<number>` – the reply to any numeric query
+_ACK_RE = re.compile(rb"^@?\d*ACK([-+0-9.eE]+)")
+
+
+class SerialPortPool:
+    """
+    Process‑wide cache of open serial ports, one handle per port name.
+
+    Opening a port is slow (tty init, DTR toggling), so a released handle
+    stays open and the next `get()` for the same port reuses it with the
+    caller's settings applied (e.g. across a unit change). Ports are
+    exclusive on Windows, so owners `discard()` a port once they are done
+    with it.
+    """
+
+    _ports: Dict[str, serial.Serial] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, port: str, **settings: Any) -> serial.Serial:
+        with cls._lock:
+            ser = cls._ports.get(port)
+            if ser is not None and ser.is_open:
+                ser.apply_settings(settings)
+            else:
+                ser = cls._ports[port] = serial.Serial(port, **settings)
+                if sys.platform == "win32":
+                    ser.set_buffer_size(rx_size=4096)
+            return ser
+
+    @classmethod
+    def release(cls, ser: serial.Serial) -> None:
+        """Hand a port back; it is kept open until `discard()`."""
+
+    @classmethod
+    def discard(cls, port: str) -> None:
+        """Close and forget a port, e.g. after an I/O error."""
+        with cls._lock:
+            ser = cls._ports.pop(port, None)
+        if ser is not None:
+            try:
+                ser.close()
+            except (OSError, serial.SerialException):
+                # Port was yanked (USB unplug / power-cycle) – ignore.
+                pass
 
-_TERMINATOR = "\\r\n"  # DigiVac default
-_POLL_DELAY = 0.05    # seconds between command & response
 
 class RS232Device(BaseDevice):
     """
@@ -31,40 +78,67 @@ class RS232Device(BaseDevice):
         self.timeout = timeout
         self._ser: Optional[serial.Serial] = None
         self._lock = threading.Lock()
+        self._prefix = f"@{address}".encode("ascii")
+        self._cmd_cache: dict[str, bytes] = {}
 
     # ---------- Private helpers ---------- #
 
-    def _format(self, payload: str) -> str:
+    def _format(self, payload: bytes) -> bytes:
         """Prepend address & append CR‑LF terminator."""
-        return f"@{self.address}{payload}{_TERMINATOR}"
+        return self._prefix + payload + _TERMINATOR
 
-    def _write(self, msg: str) -> None:
+    def _encoded_cmd(self, payload: str) -> bytes:
+        """Formatted command; built once per payload."""
+        cmd = self._cmd_cache.get(payload)
+        if cmd is None:
+            cmd = self._cmd_cache[payload] = self._format(payload.encode("ascii"))
+        return cmd
+
+    def _write(self, msg: bytes) -> None:
         if not self._ser:
             raise DeviceError("Serial port not open.")
         with self._lock:
-            self._ser.write(msg.encode("ascii"))
-            self._ser.flush()
+            try:
+                self._ser.write(msg)
+                self._ser.flush()
+            except serial.SerialException as e:
+                self._drop_port(e)
 
-    def _readline(self) -> str:
+    def _readline(self) -> bytes:
         if not self._ser:
             raise DeviceError("Serial port not open.")
-        line = self._ser.readline().decode("ascii").strip()
+        try:
+            line = self._ser.readline().strip()
+        except serial.SerialException as e:
+            self._drop_port(e)
         if not line:
             raise DeviceError("No response from device.")
         return line
 
+    def _discard_stale_input(self) -> None:
+        """Drop a late reply to an earlier query so it isn't parsed as ours."""
+        if self._ser and self._ser.in_waiting:
+            self._ser.reset_input_buffer()
+
+    def _drop_port(self, e: serial.SerialException) -> NoReturn:
+        """Evict a failed handle from the pool so the next connect reopens it."""
+        SerialPortPool.discard(self.port)
+        self._ser = None
+        raise DeviceError(f"I/O error on {self.port}: {e}") from e
+
     # ---------- Public API ---------- #
 
     def connect(self) -> None:
         try:
-            self._ser = serial.Serial(
-                self.port, self.baudrate,
+            self._ser = SerialPortPool.get(
+                self.port,
+                baudrate=self.baudrate,
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
                 timeout=self.timeout,
             )
-        except SerialException as e:
+        except serial.SerialException as e:
             raise DeviceError(
                 f"Could not open {self.port}: {e}. "
                 "Is the port busy or do you need permissions?"
@@ -72,12 +146,7 @@ class RS232Device(BaseDevice):
 
     def disconnect(self) -> None:
         if self._ser:
-            if self._ser.is_open:
-                try:
-                    self._ser.close()
-                except (OSError, serial.SerialException):
-                    # Port was yanked (USB unplug / power-cycle) – ignore.
-                    pass
+            SerialPortPool.release(self._ser)
             self._ser = None
 
     def is_connected(self) -> bool:
@@ -88,10 +157,13 @@ class RS232Device(BaseDevice):
         Send raw (already formatted) command and return raw response.
         Intended for advanced/diagnostic use.
         """
+        return self._transact(cmd.encode("ascii")).decode("ascii")
+
+    def _transact(self, cmd: bytes) -> bytes:
+        """Write one command on a clean input buffer and return its reply."""
         if self._ser:
             self._ser.reset_input_buffer()
         self._write(cmd)
-        sleep(_POLL_DELAY)
         return self._readline()
 
     # --- High‑level measurement helpers --- #
@@ -112,22 +184,42 @@ class RS232Device(BaseDevice):
             line = line[i:]
         return line
 
+    def _parse_numeric(self, line: bytes) -> float:
+        """Parse `ACK<value>` (with or without @addr prefix)."""
+        m = _ACK_RE.match(line)
+        if m is None:
+            raise DeviceError(
+                f"Unexpected response: {line.decode('ascii', 'replace')}"
+            )
+
+        try:
+            return float(m.group(1))         # handles b"7.4601E+02" just fine
+        except ValueError as ex:
+            raise DeviceError(
+                f"Bad numeric value: {line.decode('ascii', 'replace')}"
+            ) from ex
+
     def _query_numeric(self, mnemonic: str) -> float:
         """
-        Send `@addr<MN>?` and parse `ACK<value>` (with or without @addr prefix).
+        Send `@addr<MN>?` and parse the `ACK<value>` reply.
         """
-        raw_cmd = self._format(f"{mnemonic}?")
-        self._write(raw_cmd)
-        sleep(_POLL_DELAY)
-        resp = self._clean_response(self._readline())
+        self._discard_stale_input()
+        self._write(self._encoded_cmd(f"{mnemonic}?"))
+        return self._parse_numeric(self._readline())
 
-        if not resp.startswith("ACK"):
-            raise DeviceError(f"Unexpected response: {resp}")
+    def read_pt(self) -> Tuple[float, float]:
+        """
+        Pressure & temperature in a single transaction.
 
-        try:
-            return float(resp[3:])           # handles 7.4601E+02 just fine
-        except ValueError as ex:
-            raise DeviceError(f"Bad numeric value: {resp}") from ex
+        The firmware has no compound query, so both commands are written
+        back‑to‑back and the two replies read in order – one round‑trip per
+        poll instead of two.
+        """
+        self._discard_stale_input()
+        self._write(self._encoded_cmd("P?") + self._encoded_cmd("T?"))
+        pressure = self._parse_numeric(self._readline())
+        temperature = self._parse_numeric(self._readline())
+        return pressure, temperature
 
 
     def read_pressure(self) -> float:
@@ -136,6 +228,10 @@ class RS232Device(BaseDevice):
     def read_temperature(self) -> float:
         return self._query_numeric("T")
 
+    def query(self) -> Sample:
+        pressure, temperature = self.read_pt()
+        return Sample(pressure, temperature, time())
+
     def set_pressure_unit(self, unit: str) -> None:
         """
         Ensure the gauge is in the requested pressure unit.
@@ -161,7 +257,7 @@ class RS232Device(BaseDevice):
             # ignore transient query failure; we'll verify after write
             pass
 
-        cmd = self._format(f"U!P,{target}")
+        cmd = self._format(f"U!P,{target}".encode("ascii"))
 
         # 2. Write command
         self._write(cmd)
@@ -193,8 +289,8 @@ class RS232Device(BaseDevice):
         Returns 'MBAR', 'TORR', or 'PASCAL'.
         Accepts replies that include the @<addr> prefix.
         """
-        cmd = self._format("U?P")
-        resp = self.send_command(cmd)            # e.g. '@253ACKMBAR\\'
+        resp = self._transact(self._encoded_cmd("U?P"))
+        resp = resp.decode("ascii")              # e.g. '@253ACKMBAR\\'
         resp = self._clean_response(resp)        # <-- strip @addr + trailing '\'
 
         if not resp.startswith("ACK"):
@@ -6,9 +6,15 @@ from __future__ import annotations
 import math
 import time
 import random
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Tuple
+
 from .base import BaseDevice
 
+if TYPE_CHECKING:
+    import numpy as np
+
+_DECAY_K = math.log(10) / 120.0  # one decade per 120 s, as a natural-log rate
+
 class SimulatedDevice(BaseDevice):
     """
     Generates a slow logarithmic decay with noise, approximating pump‑down.
@@ -24,6 +30,7 @@ class SimulatedDevice(BaseDevice):
         self.start_pressure = start_pressure
         self.temp = temp_c
         self.noise = noise
+        self._log_p0 = math.log(start_pressure)
         self._connected = False
 
     # ---- Lifecycle ---- #
@@ -49,7 +56,8 @@ class SimulatedDevice(BaseDevice):
         """
         if not self._connected:
             raise RuntimeError("Not connected (simulation mode).")
-        base = self.start_pressure * 10 ** (-(self._elapsed() / 120.0))
+        # P0 * 10^-(t/120) == exp(ln P0 - t * ln10/120)
+        base = math.exp(self._log_p0 - _DECAY_K * self._elapsed())
         jitter = base * self.noise * (random.random() - 0.5)
         return max(base + jitter, 1e-9)
 
@@ -60,6 +68,21 @@ class SimulatedDevice(BaseDevice):
         delta = 0.5 * math.sin(self._elapsed() / 60.0)
         return self.temp + delta
 
+    def read_many(self, n: int, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorised pressure & temperature for `n` samples `dt` seconds apart,
+        starting at t=0 – same model as the scalar reads, for offline runs.
+        """
+        # imported here so live simulated polling never loads numpy
+        import numpy as np
+
+        t = np.arange(n) * dt
+        base = np.exp(self._log_p0 - _DECAY_K * t)
+        jitter = base * self.noise * (np.random.random(n) - 0.5)
+        pressure = np.maximum(base + jitter, 1e-9)
+        temperature = self.temp + 0.5 * np.sin(t / 60.0)
+        return pressure, temperature
+
     def send_command(self, cmd: str) -> str:
         """Echo back a plausible, well‑formed response."""
         if "P?" in cmd:
@@ -5,11 +5,40 @@ Thread‑safe polling loop + state store.
 from __future__ import annotations
 import threading
 import time
-from typing import Callable, Dict, Any, Optional
-from ..devices.base import BaseDevice
+from typing import Callable, Dict, Optional, Union
+from ..devices.base import BaseDevice, Sample
 from ..utils.logger import CsvLogger
 
-_CALLBACK = Callable[[Dict[str, Any]], None]
+# Subscribers get a Sample per poll, or {"error": msg} once if polling fails.
+_CALLBACK = Callable[[Union[Sample, Dict[str, str]]], None]
+
+# A sample is only logged when it differs from the last logged one by more
+# than these tolerances, or when the heartbeat interval has elapsed.
+_LOG_PRESSURE_RTOL = 1e-3   # relative
+_LOG_TEMP_ATOL = 0.01       # °C
+_LOG_HEARTBEAT = 10.0       # seconds
+
+
+# (epoch day, "YYYY-MM-DDT") – swapped as one tuple so pollers sharing it
+# never see a half-updated pair.
+_date_prefix: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp(epoch: float) -> str:
+    """
+    ISO‑8601 UTC timestamp (seconds) for `epoch`. The date part is only
+    rebuilt when the UTC day changes; the time is plain integer arithmetic.
+    """
+    global _date_prefix
+    day, secs = divmod(int(epoch), 86400)
+    cached_day, date = _date_prefix
+    if day != cached_day:
+        t = time.gmtime(day * 86400)
+        date = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T"
+        _date_prefix = (day, date)
+    hours, secs = divmod(secs, 3600)
+    minutes, secs = divmod(secs, 60)
+    return f"{date}{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
 class MeasurementModel:
@@ -26,10 +55,15 @@ class MeasurementModel:
     ) -> None:
         self.device = device
         self.poll_interval = poll_interval
-        self._callbacks: list[_CALLBACK] = []
+        self._callbacks: tuple[_CALLBACK, ...] = ()
         self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
         self._stop = threading.Event()
         self.logger = CsvLogger(prefix=log_prefix, unit=unit)
+        self._last_logged: tuple[Optional[float], Optional[float]] = (None, None)
+        self._last_log_time = 0.0
+        # Persisting is just another subscriber, dispatched with the rest.
+        self.subscribe(self._log_cb)
 
     # -------- Public API -------- #
 
@@ -37,41 +71,85 @@ class MeasurementModel:
         if self._thread and self._thread.is_alive():
             return
         self.device.connect()
+        self.logger.reopen()  # stop() closed it; a restart keeps logging
         self._stop.clear()
-        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._error = None
+        # one daemon thread per model: a loop runs until stopped, so a shared
+        # pool would run out, and daemons never hold up interpreter exit
+        self._thread = threading.Thread(target=self._run, name="poll", daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
+        """Stop polling; re-raises anything that killed the poll loop."""
         self._stop.set()
         if self._thread:
             self._thread.join()
         self.device.disconnect()
+        self.logger.close()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
 
     def subscribe(self, cb: _CALLBACK) -> None:
-        """Register a callback executed on every new measurement dict."""
-        self._callbacks.append(cb)
+        """Register a callback executed on every new measurement."""
+        # Copy‑on‑write: the poller iterates whichever tuple it last read,
+        # so subscribing mid‑run never mutates a sequence in use.
+        self._callbacks = self._callbacks + (cb,)
 
     # -------- Internal -------- #
 
+    def _run(self) -> None:
+        try:
+            self._loop()
+        except BaseException as ex:
+            self._error = ex
+            raise  # threading.excepthook prints the traceback right away
+
     def _loop(self) -> None:
-        while not self._stop.is_set():
+        # Ticks are scheduled against a monotonic deadline so the period
+        # stays at poll_interval regardless of how long query/logging take.
+        # Waiting on the stop event (rather than sleeping) is both the pacing
+        # and the exit check: stop() wakes the poller immediately.
+        next_tick = time.monotonic()
+        delay = 0.0
+        while not self._stop.wait(delay):
+            cbs = self._callbacks
             try:
                 data = self.device.query()
             except Exception as ex:
-                for cb in self._callbacks:
+                for cb in cbs:
                     cb({"error": f"{type(ex).__name__}: {ex}"})
-                break  # terminate polling thread
+                break  # terminate polling task
 
-            for cb in self._callbacks:
+            for cb in cbs:
                 cb(data)
-            # Persist to disk
-            self.logger.append(
-                [
-                    time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()),
-                    self.logger._file_path.stem.split("_")[1],  # the unit part of the filename
-                    data["pressure"],
-                    data["temperature"],
-                    "",  # placeholder for setpoint status
-                ]
+            next_tick += self.poll_interval
+            delay = next_tick - time.monotonic()
+            if delay < -self.poll_interval:
+                # More than a period behind (slow device): resync, don't burst.
+                next_tick = time.monotonic()
+            delay = max(0.0, delay)
+
+    def _log_cb(self, data: Union[Sample, Dict[str, str]]) -> None:
+        """Persist a sample to disk; unchanged readings are skipped."""
+        if isinstance(data, Sample) and self._should_log(
+            data.pressure, data.temperature
+        ):
+            self.logger.append_fast(
+                _utc_timestamp(data.ts), data.pressure, data.temperature
             )
-            time.sleep(self.poll_interval)
+
+    def _should_log(self, pressure: float, temperature: float) -> bool:
+        """True if the sample moved past the log tolerances (or is due)."""
+        now = time.monotonic()
+        last_p, last_t = self._last_logged
+        if (
+            last_p is None
+            or abs(pressure - last_p) > _LOG_PRESSURE_RTOL * max(abs(last_p), 1e-12)
+            or abs(temperature - last_t) > _LOG_TEMP_ATOL
+            or now - self._last_log_time >= _LOG_HEARTBEAT
+        ):
+            self._last_logged = (pressure, temperature)
+            self._last_log_time = now
+            return True
+        return False
@@ -5,54 +5,120 @@ Run `streamlit run app.py`
 
 from __future__ import annotations
 
-import time
-from queue import Empty
 from typing import List
 
 import pandas as pd
 import streamlit as st
 
-try:
-    from serial.tools.list_ports import comports
-except ImportError:  # pyserial not installed yet
-    comports = lambda: []  # noqa: E731
-
 from ..controller.controller import Controller
 
+_MAX_POINTS = 5000  # samples kept for metrics/charts per session
+_REFRESH_S = 0.2    # dashboard refresh period while polling
+
+# st.fragment is stable from 1.37; 1.33–1.36 only have the experimental name
+_fragment = getattr(st, "fragment", None) or st.experimental_fragment
+
 
 # --------------------------------------------------------------------------- #
 # ------------------------------  HELPERS  ---------------------------------- #
 # --------------------------------------------------------------------------- #
+@st.cache_data(ttl=5.0, show_spinner=False)
 def _discover_ports() -> List[str]:
+    # enumeration walks sysfs / SetupAPI; hot-plugging mid-run is rare
+    # imported lazily so simulation-only sessions never load pyserial
+    try:
+        from serial.tools.list_ports import comports
+    except ImportError:  # pyserial not installed yet
+        return []
     return [p.device for p in comports()]
 
 
-def _drain_queue(ctrl: Controller) -> None:
-    """Pull ALL queued updates into session‑level DataFrame."""
-    df: pd.DataFrame = st.session_state.data
-    while True:
-        try:
-            item = ctrl.queue.get_nowait()
-            if "error" in item:  # device error sent by Model
-                st.session_state.error_msg = item["error"]
-                ctrl.stop()
-                break
-            df.loc[len(df)] = {
-                "timestamp": pd.Timestamp.utcnow(),
-                "pressure": item["pressure"],
-                "temperature": item["temperature"],
-            }
-        except Empty:
+def _empty_data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {"pressure": [], "temperature": []},
+        index=pd.DatetimeIndex([], name="timestamp"),
+    )
+
+
+def _drain_queue(ctrl: Controller) -> int:
+    """
+    Pull ALL queued updates into the session‑level, timestamp‑indexed
+    DataFrame. New samples are collected in plain lists and appended as
+    one block, so reruns with nothing new leave the cached frame as is.
+    Returns the number of samples added.
+    """
+    timestamps: List[float] = []  # epoch seconds, stamped at read time
+    pressures: List[float] = []
+    temperatures: List[float] = []
+    for item in ctrl.drain_all():
+        if isinstance(item, dict):  # device error sent by Model
+            st.session_state.error_msg = item["error"]
+            ctrl.stop()
             break
+        timestamps.append(item.ts)
+        pressures.append(item.pressure)
+        temperatures.append(item.temperature)
+
+    if timestamps:
+        new = pd.DataFrame(
+            {"pressure": pressures, "temperature": temperatures},
+            index=pd.DatetimeIndex(
+                pd.to_datetime(timestamps, unit="s", utc=True), name="timestamp"
+            ),
+        )
+        df: pd.DataFrame = st.session_state.data
+        df = pd.concat([df, new]) if not df.empty else new
+        # keep only the most recent window: bounded memory & chart cost
+        st.session_state.data = df.iloc[-_MAX_POINTS:]
+    return len(timestamps)
 
 
 def _reset_data() -> None:
-    st.session_state.data = pd.DataFrame(
-        columns=["timestamp", "pressure", "temperature"]
-    )
+    st.session_state.data = _empty_data()
     st.session_state.error_msg = ""
 
 
+def _dashboard(ctrl: Controller, unit: str) -> None:
+    """Metrics & charts; runs as a fragment on its own refresh tick."""
+    had_error = bool(st.session_state.error_msg)
+    _drain_queue(ctrl)
+    if st.session_state.error_msg and not had_error:
+        # device error: full rerun so the banner and sidebar pick it up
+        st.rerun()
+    df: pd.DataFrame = st.session_state.data
+
+    col_metric_p, col_metric_t = st.columns(2)
+    col_chart_p, col_chart_t = st.columns(2)
+
+    # Metrics
+    if not df.empty:
+        col_metric_p.metric(
+            f"Current Pressure ({unit})", f"{df.pressure.iloc[-1]:.3e}"
+        )
+        col_metric_t.metric(
+            "Current Temperature (°C)", f"{df.temperature.iloc[-1]:.2f}"
+        )
+    else:
+        col_metric_p.metric("Current Pressure (mbar)", "—")
+        col_metric_t.metric("Current Temperature (°C)", "—")
+
+    # Charts
+    with col_chart_p:
+        st.subheader("Pressure vs. Time")
+        st.line_chart(
+            df["pressure"]
+            if not df.empty
+            else pd.Series(dtype=float)
+        )
+    with col_chart_t:
+        st.subheader("Temperature vs. Time")
+        st.line_chart(
+            df["temperature"]
+            if not df.empty
+            else pd.Series(dtype=float)
+        )
+
+
 # --------------------------------------------------------------------------- #
 # ------------------------------  MAIN UI  ---------------------------------- #
 # --------------------------------------------------------------------------- #
@@ -85,14 +151,12 @@ def render() -> None:
         help="Select the pressure unit for both UI display and log files.",
     )
 
-    # Detect dropdown change AFTER a connection is active
+    # Detect dropdown change AFTER a connection is active (samples arrived)
     if "current_unit" not in st.session_state:
         st.session_state.current_unit = unit
-    if ctrl.queue.qsize() and unit != st.session_state.current_unit:
-        # clear DF & charts
-        st.session_state.data = pd.DataFrame(
-            columns=["timestamp", "pressure", "temperature"]
-        )
+    if not st.session_state.data.empty and unit != st.session_state.current_unit:
+        # clear data & charts
+        st.session_state.data = _empty_data()
         ctrl.change_unit(unit, poll_int)
         st.session_state.current_unit = unit
 
@@ -134,42 +198,7 @@ def render() -> None:
                 st.session_state.error_msg = ""
 
     # ------------------ Main dashboard ---------------- #
-    _drain_queue(ctrl)
-    df: pd.DataFrame = st.session_state.data
-
-    col_metric_p, col_metric_t = st.columns(2)
-    col_chart_p, col_chart_t = st.columns(2)
-
-    # Metrics
-    if not df.empty:
-        col_metric_p.metric(
-            f"Current Pressure ({unit})", f"{df.pressure.iloc[-1]:.3e}"
-        )
-        col_metric_t.metric(
-            "Current Temperature (°C)", f"{df.temperature.iloc[-1]:.2f}"
-        )
-    else:
-        col_metric_p.metric("Current Pressure (mbar)", "—")
-        col_metric_t.metric("Current Temperature (°C)", "—")
-
-    # Charts
-    with col_chart_p:
-        st.subheader("Pressure vs. Time")
-        st.line_chart(
-            df.set_index("timestamp")["pressure"]
-            if not df.empty
-            else pd.Series(dtype=float)
-        )
-    with col_chart_t:
-        st.subheader("Temperature vs. Time")
-        st.line_chart(
-            df.set_index("timestamp")["temperature"]
-            if not df.empty
-            else pd.Series(dtype=float)
-        )
-
-    # --------------- Auto‑refresh tick --------------- #
-    if ctrl.queue.qsize() or getattr(ctrl, "_model", None):
-        time.sleep(0.2)
-        # streamlit 1.4 has experimental_rerun; >=1.29 has rerun
-        (st.rerun if hasattr(st, "rerun") else st.experimental_rerun)()
+    # Only the dashboard re-executes on the refresh tick, not the whole
+    # script; ticking stops with the model (picked up on the next full run).
+    refresh = _REFRESH_S if getattr(ctrl, "_model", None) else None
+    _fragment(run_every=refresh)(_dashboard)(ctrl, unit)
@@ -5,34 +5,157 @@ Light‑weight CSV logger for measurement records.
 from __future__ import annotations
 from pathlib import Path
 from datetime import datetime
+from queue import Queue
+import atexit
 import csv
+import io
+import os
+import threading
+import time
+import warnings
 from typing import Iterable
 
+_BATCH_ROWS = 32       # hand rows to the writer once this many are pending …
+_BATCH_INTERVAL = 1.0  # … or this many seconds after the first of them
+_STOP = object()       # queue sentinel: drain and exit the writer thread
+# header row; `append_fast` rows follow this layout
+_COLUMNS = ("timestamp_utc", "unit", "pressure", "temperature")
+
 
 class CsvLogger:
     """
     Appends measurement rows to a CSV file.
     Filename prefix indicates 'real' or 'sim'.
+
+    Rows are collected into batches and handed to a background writer
+    thread, so a slow disk never stalls the caller; `close()` writes out
+    everything pending (also done automatically at interpreter exit).
+    Appending to a closed logger raises; `reopen()` resumes the same file.
     """
 
     def __init__(self, prefix: str, unit: str, directory: str | Path = "logs") -> None:
         self._base_dir = Path(directory)
         self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._prefix = prefix
+        self._unit = unit
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         # include unit in the filename
         self._file_path = self._base_dir / f"{prefix}_{unit}_measurements_{timestamp}.csv"
 
-        with self._file_path.open("w", newline="") as f:
-            writer = csv.writer(f)
-            # include unit as a column
-            writer.writerow(
-                ["timestamp_utc", "unit", "pressure", "temperature", "setpoint_status"]
-            )
+        self._batch = bytearray()
+        self._batch_rows = 0
+        self._batch_started = 0.0
+        self._fd: int | None = None
+        self._open()
+        # include unit as a column
+        header = io.StringIO()
+        csv.writer(header).writerow(_COLUMNS)
+        self._write(header.getvalue().encode("utf-8"))
 
     @property
     def file_path(self) -> Path:
         return self._file_path
 
+    @property
+    def prefix(self) -> str:
+        return self._prefix
+
+    @property
+    def unit(self) -> str:
+        return self._unit
+
+    @property
+    def closed(self) -> bool:
+        return self._fd is None
+
     def append(self, row: Iterable) -> None:
-        with self._file_path.open("a", newline="") as f:
-            csv.writer(f).writerow(row)
+        """Queue an arbitrary row (quoted/escaped by the csv module)."""
+        buf = io.StringIO()
+        csv.writer(buf).writerow(row)
+        self._enqueue(buf.getvalue().encode("utf-8"))
+
+    def append_fast(self, ts: str, pressure: float, temperature: float) -> None:
+        """
+        Queue a measurement row (`_COLUMNS` layout). The fields
+        never need quoting, so the line is formatted directly – same output
+        as `append`, no csv module.
+        """
+        self._enqueue(
+            f"{ts},{self._unit},{pressure},{temperature}\r\n".encode("ascii")
+        )
+
+    def close(self) -> None:
+        """Write out everything queued so far, stop the writer and close the file."""
+        if self._thread.is_alive():
+            if self._batch:
+                self._q.put(self._batch)
+                self._batch = bytearray()
+                self._batch_rows = 0
+            self._q.put(_STOP)
+            self._thread.join()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        atexit.unregister(self.close)
+
+    def reopen(self) -> None:
+        """Resume appending to the same file after `close()`."""
+        if self._fd is None:
+            self._open()
+
+    # -------- Internal -------- #
+
+    def _open(self) -> None:
+        # Raw fd, kept open until close(): rows are ASCII bytes built by the
+        # producer, so no text layer is needed between them and the disk.
+        # O_BINARY (Windows only) stops the CRT turning "\r\n" into "\r\r\n".
+        self._fd = os.open(
+            self._file_path,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        self._write_error: OSError | None = None
+        self._q: "Queue[object]" = Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _enqueue(self, line: bytes) -> None:
+        if self._fd is None:
+            raise ValueError(f"CsvLogger for {self._file_path} is closed")
+        if self._write_error is not None:
+            return  # file unwritable (already reported): don't pile up rows
+        if not self._batch_rows:
+            self._batch_started = time.monotonic()
+        self._batch += line
+        self._batch_rows += 1
+        if (
+            self._batch_rows >= _BATCH_ROWS
+            or time.monotonic() - self._batch_started >= _BATCH_INTERVAL
+        ):
+            self._q.put(self._batch)
+            self._batch = bytearray()
+            self._batch_rows = 0
+
+    def _write(self, data: bytes | bytearray) -> None:
+        view = memoryview(data)
+        while view:  # os.write may accept only part of the buffer
+            view = view[os.write(self._fd, view):]
+
+    def _run(self) -> None:
+        """Writer thread: one os.write() per batch until the sentinel."""
+        q = self._q
+        while True:
+            batch = q.get()
+            if batch is _STOP:
+                return
+            if self._write_error is not None:
+                continue  # keep draining so close() still returns
+            try:
+                self._write(batch)
+            except OSError as e:  # disk full, drive removed, …
+                self._write_error = e
+                warnings.warn(
+                    f"Logging to {self._file_path} stopped: {e}",
+                    RuntimeWarning,
+                )
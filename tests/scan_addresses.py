@@ -6,16 +6,28 @@ scan_addresses.py
 2) Prompts you to select one.
 3) Probes addresses 1–253 with a 'P?' query and reports any responders,
    showing progress as it goes.
+
+Probes are pipelined: each one gets a short listen window instead of a
+full timeout, and replies are matched to addresses by their '@<addr>'
+prefix. A reply without the prefix can't be attributed that way, so the
+addresses that might have sent it are re-probed one at a time, waiting
+for each reply, once the sweep is done.
 """
 
+import re
 import serial
 import sys
-from time import sleep
+import time
 from serial.tools import list_ports
 
 TERMINATOR = "\r\n"
 BAUDRATE = 9600
-TIMEOUT  = 0.5
+TIMEOUT  = 0.5          # longest a gauge may take to reply
+PROBE_WINDOW = 0.02     # listen this long after each probe before the next
+
+_REPLY_RE = re.compile(r"^@?(\d*)ACK")
+# Probe frames, indexed by address (0 unused)
+CMDS = [f"@{addr}P?{TERMINATOR}".encode("ascii") for addr in range(254)]
 
 
 def pick_port() -> str:
@@ -40,40 +52,103 @@ def pick_port() -> str:
         print(f"▶️  Invalid choice, must be between 1 and {len(ports)}.")
 
 
+def report(addr: int, resp: str, found: dict) -> None:
+    if addr not in found:
+        found[addr] = resp
+        print(f"[+] Addr {addr:3d}: {resp}")
+
+
+def collect(pending: bytes, owner: int, found: dict, unsure: set) -> bytes:
+    """
+    Record every complete reply line in `pending` and return the
+    incomplete tail. Replies are attributed by their '@<addr>' prefix;
+    for an un-prefixed one, `owner` (the probe that was current when it
+    began) goes into `unsure` for a blocking re-check.
+    """
+    *lines, tail = pending.split(b"\n")
+    for raw in lines:
+        resp = raw.decode("ascii", errors="ignore").strip()
+        m = _REPLY_RE.match(resp)
+        if m:
+            if m.group(1):
+                report(int(m.group(1)), resp, found)
+            else:
+                unsure.add(owner)
+    return tail
+
+
+def verify(ser: serial.Serial, addrs: list, found: dict) -> None:
+    """Probe `addrs` one by one, waiting up to TIMEOUT for each reply."""
+    ser.timeout = TIMEOUT
+    for addr in addrs:
+        print(f"  Re-checking address {addr:3d} …", end="\r", flush=True)
+        ser.reset_input_buffer()
+        ser.write(CMDS[addr])
+        resp = ser.readline().decode("ascii", errors="ignore").strip()
+        if _REPLY_RE.match(resp):
+            report(addr, resp, found)
+
+
 def scan(port: str) -> None:
     """
-    Open the serial port once, then probe each address,
+    Open the serial port once, then probe each address back-to-back,
     printing progress and any responders.
     """
     try:
-        ser = serial.Serial(port, BAUDRATE, timeout=TIMEOUT)
+        ser = serial.Serial(port, BAUDRATE, timeout=PROBE_WINDOW)
     except serial.SerialException as e:
         print(f"❌ Error opening {port}: {e}")
         sys.exit(1)
 
     print(f"🔍 Scanning addresses 1–253 on {port} at {BAUDRATE} bps…")
-    found = []
+    found: dict = {}
+    unsure: set = set()
+    sent = [0.0] * 254  # monotonic send time per address
+    pending = b""
+    owner = 1
+    ser.reset_input_buffer()
+    ser.reset_output_buffer()
 
     for addr in range(1, 254):
         # Progress update
         print(f"  Probing address {addr:3d} …", end="\r", flush=True)
 
-        cmd = f"@{addr}P?{TERMINATOR}"
-        ser.reset_input_buffer()
-        ser.reset_output_buffer()
-        ser.write(cmd.encode("ascii"))
-        sleep(0.1)
-        resp = ser.readline().decode("ascii", errors="ignore").strip()
-        if resp.startswith("ACK"):
-            found.append((addr, resp))
-            print(f"[+] Addr {addr:3d}: {resp}")
+        sent[addr] = time.monotonic()
+        ser.write(CMDS[addr])
+        # blocks ≤ PROBE_WINDOW for the first byte, then takes what's there
+        chunk = ser.read(max(1, ser.in_waiting))
+        if not pending:
+            owner = addr
+        pending = collect(pending + chunk, owner, found, unsure)
+        if b"\n" in chunk:
+            owner = addr  # anything left over started after this probe
+
+    # Late replies to the last few probes
+    ser.timeout = TIMEOUT
+    while True:
+        chunk = ser.read(max(1, ser.in_waiting))
+        if not chunk:
+            break
+        pending = collect(pending + chunk, owner, found, unsure)
+    collect(pending + b"\n", owner, found, unsure)
+
+    # An un-prefixed reply that began during probe N answers N or any
+    # probe sent up to TIMEOUT before it.
+    suspects = sorted({
+        addr
+        for owner in unsure
+        for addr in range(1, owner + 1)
+        if sent[addr] >= sent[owner] - TIMEOUT and addr not in found
+    })
+    if suspects:
+        verify(ser, suspects, found)
 
     ser.close()
     print(" " * 40, end="\r")  # clear the last progress line
 
     if found:
         print("\n✅ Responders found:")
-        for addr, resp in found:
+        for addr, resp in sorted(found.items()):
             print(f" • {addr:3d} → {resp}")
     else:
         print("\n❌ No devices replied on any address 1–253.")
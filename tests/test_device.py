@@ -1,3 +1,6 @@
+import pytest
+
+from src.devices.base import DeviceError
 from src.devices.simulated_device import SimulatedDevice
 
 def test_simulated_device_basic():
@@ -8,3 +11,69 @@ def test_simulated_device_basic():
     assert p1 > 0.0
     assert 0.0 < t1 < 100.0
     dev.disconnect()
+
+def test_simulated_device_read_many():
+    dev = SimulatedDevice(noise=0.0)
+    p, t = dev.read_many(1000, 0.5)
+    assert p.shape == t.shape == (1000,)
+    assert p[0] == pytest.approx(dev.start_pressure)
+    assert p[240] == pytest.approx(dev.start_pressure / 10)  # one decade per 120 s
+    assert (p[1:] < p[:-1]).all()
+
+
+class FakeSerial:
+    """Stands in for serial.Serial: replays canned reply lines."""
+
+    def __init__(self, *replies: bytes) -> None:
+        self.replies = list(replies)
+        self.written = b""
+        self.in_waiting = 0
+        self.is_open = True
+
+    def write(self, data: bytes) -> None:
+        self.written += data
+
+    def flush(self) -> None:
+        pass
+
+    def readline(self) -> bytes:
+        return self.replies.pop(0) if self.replies else b""
+
+    def reset_input_buffer(self) -> None:
+        self.replies.clear()
+        self.in_waiting = 0
+
+
+def _rs232(*replies: bytes):
+    # imported here so collecting the simulated tests never loads pyserial
+    from src.devices.rs232_device import RS232Device
+
+    dev = RS232Device("FAKE", address=253)
+    dev._ser = FakeSerial(*replies)
+    return dev
+
+
+@pytest.mark.parametrize(
+    "reply", [b"@253ACK7.4601E+02\\\r\n", b"ACK7.4601E+02\r\n"]
+)
+def test_rs232_parses_ack_with_and_without_prefix(reply):
+    assert _rs232(reply).read_pressure() == pytest.approx(746.01)
+
+
+@pytest.mark.parametrize("reply", [b"@253NAK160\r\n", b"@253ACK1.2.3\r\n", b""])
+def test_rs232_bad_reply_raises(reply):
+    with pytest.raises(DeviceError):
+        _rs232(reply).read_pressure()
+
+
+def test_rs232_read_pt_pipelines_and_reads_in_order():
+    dev = _rs232(b"@253ACK1.0E-03\r\n", b"@253ACK22.5\r\n")
+    assert dev.read_pt() == (pytest.approx(1e-3), pytest.approx(22.5))
+    assert dev._ser.written == b"@253P?\\r\n@253T?\\r\n"
+
+
+def test_rs232_discards_stale_reply():
+    dev = _rs232(b"@253ACK9.9\r\n")  # late answer to an earlier query
+    dev._ser.in_waiting = len(dev._ser.replies[0])
+    dev._ser.write = lambda data: dev._ser.replies.append(b"@253ACK1.0\r\n")
+    assert dev.read_pressure() == pytest.approx(1.0)
@@ -1,8 +1,13 @@
+import random
 import time
 from queue import Queue
 
+import pytest
+
 from src.devices.simulated_device import SimulatedDevice
-from src.model.model import MeasurementModel
+from src.model import model as model_mod
+from src.model.model import MeasurementModel, _utc_timestamp
+from src.utils.logger import CsvLogger
 
 def test_model_loop():
     q: "Queue[dict]" = Queue()
@@ -12,3 +17,71 @@ def test_model_loop():
     time.sleep(0.6)
     model.stop()
     assert not q.empty()
+
+# the poll thread also reports the crash via threading.excepthook
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_stop_reraises_loop_error(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)  # the model's logger writes to ./logs
+
+    def broken(_):
+        raise ValueError("subscriber bug")
+
+    model = MeasurementModel(SimulatedDevice(), poll_interval=0.05)
+    model.subscribe(broken)
+    model.start()
+    time.sleep(0.2)
+    with pytest.raises(ValueError, match="subscriber bug"):
+        model.stop()
+
+
+def test_csv_header_and_fast_rows(tmp_path):
+    logger = CsvLogger(prefix="sim", unit="torr", directory=tmp_path)
+    logger.append_fast("2026-01-02T03:04:05", 1.5e-3, 22.25)
+    logger.append(["2026-01-02T03:04:06", "torr", 1.5e-3, 22.25])
+    logger.close()
+    assert logger.file_path.read_bytes() == (
+        b"timestamp_utc,unit,pressure,temperature\r\n"
+        b"2026-01-02T03:04:05,torr,0.0015,22.25\r\n"
+        b"2026-01-02T03:04:06,torr,0.0015,22.25\r\n"
+    )
+
+
+def test_log_gate_skips_unchanged_until_heartbeat(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)  # the model's logger writes to ./logs
+    now = [1000.0]
+    monkeypatch.setattr(model_mod.time, "monotonic", lambda: now[0])
+    model = MeasurementModel(SimulatedDevice())
+    try:
+        assert model._should_log(1.0, 20.0)          # first sample
+        assert not model._should_log(1.0005, 20.005)  # within tolerances
+        assert model._should_log(1.002, 20.0)         # pressure moved
+        assert model._should_log(1.002, 20.02)        # temperature moved
+        now[0] += model_mod._LOG_HEARTBEAT
+        assert model._should_log(1.002, 20.02)        # heartbeat due
+    finally:
+        model.logger.close()
+
+
+def test_utc_timestamp_matches_strftime():
+    rng = random.Random(0)
+    for _ in range(10_000):
+        epoch = rng.uniform(0, 4_102_444_800)  # 1970 … 2100
+        assert _utc_timestamp(epoch) == time.strftime(
+            "%Y-%m-%dT%H:%M:%S", time.gmtime(epoch)
+        )
+
+
+def test_restarted_model_keeps_logging(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(model_mod, "_LOG_HEARTBEAT", 0.0)  # log every sample
+    model = MeasurementModel(SimulatedDevice(), poll_interval=0.02)
+    rows = 1  # header
+    for _ in range(2):
+        model.start()
+        time.sleep(0.1)
+        model.stop()
+        logged = len(model.logger.file_path.read_bytes().splitlines())
+        assert logged > rows
+        rows = logged
+    with pytest.raises(ValueError):
+        model.logger.append_fast("2026-01-01T00:00:00", 1.0, 20.0)